@@ -16,28 +16,156 @@ The runner checks:
 """
 
 import argparse
+import functools
 import json
 import os
+import shlex
 import subprocess
 import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Prefer the C-accelerated orjson when available; fall back to stdlib json.
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj):
+        return json.dumps(obj)
 
 FIXTURES_PATH = os.path.join(os.path.dirname(__file__), "fixtures.json")
 REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 
+CATEGORIES_SET = frozenset(["happy_path", "edge_case", "error_handling", "security"])
+
+
+@functools.lru_cache(maxsize=None)
+def _load_json(path):
+    """Parse a JSON file once per path; callers only read the result."""
+    with open(path, "rb") as f:
+        return _loads(f.read())
+
 
 def load_fixtures():
-    with open(FIXTURES_PATH) as f:
-        return json.load(f)
+    return _load_json(FIXTURES_PATH)
 
 
-def run_validator(validator_cmd, args, cwd=None):
+def run_validator(validator_tokens, args, cwd=None):
     """Run a validator command and return (exit_code, stdout, stderr)."""
-    cmd = validator_cmd.split() + args
-    result = subprocess.run(cmd, capture_output=True, text=True, cwd=cwd or REPO_ROOT)
+    cmd = validator_tokens + args
+    # DEVNULL skips allocating a pipe for unused stdin; close_fds=False skips
+    # the per-spawn fd sweep (safe — the runner holds no sensitive fds).
+    result = subprocess.run(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        cwd=cwd or REPO_ROOT,
+        close_fds=False,
+    )
     return result.returncode, result.stdout, result.stderr
 
 
+# The only validator that speaks the --worker protocol. Relative script
+# paths resolve against REPO_ROOT, matching the subprocess cwd below.
+_REFERENCE_VALIDATOR = os.path.join(REPO_ROOT, "validators", "shadow-score.py")
+
+
+def uses_worker_mode(validator_tokens):
+    """True only for the reference Python validator. --worker is an
+    implementation detail of shadow-score.py, not part of the conformance
+    interface, so any other Python validator stays on plain subprocess runs."""
+    return (
+        len(validator_tokens) == 2
+        and os.path.basename(validator_tokens[0]).startswith("python")
+        and os.path.normpath(os.path.join(REPO_ROOT, validator_tokens[1]))
+        == _REFERENCE_VALIDATOR
+    )
+
+
+class ValidatorWorker:
+    """A long-lived validator subprocess in --worker mode.
+
+    Speaks line-delimited JSON over stdin/stdout, so one interpreter startup
+    is amortized across every fixture the worker serves.
+    """
+
+    def __init__(self, validator_tokens):
+        self.proc = subprocess.Popen(
+            validator_tokens + ["--worker"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            cwd=REPO_ROOT,
+        )
+
+    def request(self, payload):
+        """Send one request dict; return (exit_code, stdout)."""
+        self.proc.stdin.write(_dumps(payload) + "\n")
+        self.proc.stdin.flush()
+        line = self.proc.stdout.readline()
+        if not line:
+            raise RuntimeError("validator worker exited unexpectedly")
+        response = _loads(line)
+        return response["exit_code"], response["stdout"]
+
+    def close(self):
+        try:
+            self.proc.stdin.close()
+        except OSError:
+            pass
+        self.proc.wait()
+
+
+# One worker per pool thread, so concurrent fixtures never interleave on a
+# single pipe. All spawned workers are tracked for shutdown in main().
+_worker_local = threading.local()
+_workers = []
+_workers_lock = threading.Lock()
+
+# Shared directory for sealed_inline temp files, created once in main().
+_inline_dir = None
+
+
+def _get_worker(validator_tokens):
+    worker = getattr(_worker_local, "worker", None)
+    if worker is None:
+        worker = ValidatorWorker(validator_tokens)
+        _worker_local.worker = worker
+        with _workers_lock:
+            _workers.append(worker)
+    return worker
+
+
+def _dig(d, path):
+    """Walk a nested dict along a key path; None if any level is missing."""
+    for key in path:
+        d = d.get(key) if isinstance(d, dict) else None
+    return d
+
+
+def _flatten_checks(expected):
+    """Flatten an expected_output dict into (key_path, expected_value) pairs."""
+    checks = []
+    if "report" in expected:
+        for field in ["gap_score", "level"]:
+            checks.append((("report", field), expected["report"][field]))
+    if "sealed_tests" in expected:
+        for field in ["total", "passed", "failed"]:
+            checks.append((("sealed_tests", field), expected["sealed_tests"][field]))
+    return checks
+
+
 def check_output(fixture, actual_output):
     """Compare actual JSON output against expected. Returns list of errors."""
     expected = fixture.get("expected_output")
@@ -46,8 +174,8 @@ def check_output(fixture, actual_output):
 
     errors = []
     try:
-        actual = json.loads(actual_output)
-    except json.JSONDecodeError as e:
+        actual = _loads(actual_output)
+    except ValueError as e:
         return [f"Invalid JSON output: {e}"]
 
     # Check required top-level fields
@@ -55,26 +183,15 @@ def check_output(fixture, actual_output):
         if key not in actual:
             errors.append(f"Missing required key: {key}")
 
-    # Check report values
-    if "report" in actual and "report" in expected:
-        if actual["report"].get("gap_score") != expected["report"]["gap_score"]:
-            errors.append(
-                f"gap_score: expected {expected['report']['gap_score']}, "
-                f"got {actual['report'].get('gap_score')}"
-            )
-        if actual["report"].get("level") != expected["report"]["level"]:
-            errors.append(
-                f"level: expected {expected['report']['level']}, "
-                f"got {actual['report'].get('level')}"
-            )
-
-    # Check sealed_tests counts
-    if "sealed_tests" in actual and "sealed_tests" in expected:
-        for field in ["total", "passed", "failed"]:
-            exp_val = expected["sealed_tests"][field]
-            act_val = actual["sealed_tests"].get(field)
-            if act_val != exp_val:
-                errors.append(f"sealed_tests.{field}: expected {exp_val}, got {act_val}")
+    # Compare flattened value checks in one pass; the flattened table is
+    # memoized on the fixture so repeat runs skip the rebuild.
+    checks = fixture.get("_checks")
+    if checks is None:
+        checks = fixture["_checks"] = _flatten_checks(expected)
+    for path, exp_val in checks:
+        act_val = _dig(actual, path)
+        if act_val != exp_val:
+            errors.append(f"{'.'.join(path)}: expected {exp_val}, got {act_val}")
 
     # Check failure count
     if "failures" in actual and "failures" in expected:
@@ -89,41 +206,68 @@ def check_output(fixture, actual_output):
         if "coverage_comparison" not in actual:
             errors.append("Missing coverage_comparison (expected when --open provided)")
         else:
-            for cat in ["happy_path", "edge_case", "error_handling", "security"]:
-                if cat not in actual["coverage_comparison"]:
-                    errors.append(f"Missing coverage_comparison.{cat}")
+            # One C-level set difference instead of per-category lookups;
+            # sorted so error output stays deterministic.
+            missing = CATEGORIES_SET - actual["coverage_comparison"].keys()
+            for cat in sorted(missing):
+                errors.append(f"Missing coverage_comparison.{cat}")
 
     return errors
 
 
-def run_fixture(validator_cmd, fixture):
+def run_fixture(validator_tokens, fixture, use_worker=False):
     """Run a single fixture. Returns (passed, errors)."""
     inp = fixture["input"]
-    args = []
-
-    # Handle sealed input (file reference or inline)
-    if "sealed" in inp:
-        args.extend(["--sealed", os.path.join(REPO_ROOT, inp["sealed"])])
-    elif "sealed_inline" in inp:
-        tmp = tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False)
-        json.dump(inp["sealed_inline"], tmp)
-        tmp.close()
-        args.extend(["--sealed", tmp.name])
-
-    # Handle open input
-    if "open" in inp:
-        args.extend(["--open", os.path.join(REPO_ROOT, inp["open"])])
 
-    # Handle threshold
-    if "threshold" in inp:
-        args.extend(["--threshold", str(inp["threshold"])])
+    open_path = os.path.join(REPO_ROOT, inp["open"]) if "open" in inp else None
+    threshold = inp.get("threshold")
+
+    ran = False
+    if use_worker:
+        # Inline fixtures go straight into the worker payload — no tempfile.
+        # check_output only re-parses the report, so compact JSON suffices,
+        # and exit-code-only fixtures skip report formatting altogether.
+        payload = {
+            "open": open_path,
+            "threshold": threshold,
+            "compact": True,
+            "quiet": "expected_output" not in fixture,
+        }
+        if "sealed" in inp:
+            payload["sealed"] = os.path.join(REPO_ROOT, inp["sealed"])
+        elif "sealed_inline" in inp:
+            payload["sealed_json"] = inp["sealed_inline"]
+        try:
+            exit_code, stdout = _get_worker(validator_tokens).request(payload)
+            ran = True
+        except (RuntimeError, OSError):
+            # The worker failed to start or died mid-run. Drop it and fall
+            # back to a one-shot subprocess so this fixture still reports a
+            # result instead of aborting the whole run.
+            _worker_local.worker = None
+    if not ran:
+        # External validators only take file paths, so inline fixtures still
+        # get materialized into the shared temp directory.
+        if "sealed" in inp:
+            sealed_path = os.path.join(REPO_ROOT, inp["sealed"])
+        elif "sealed_inline" in inp:
+            tmp = tempfile.NamedTemporaryFile(
+                mode="w", suffix=".json", dir=_inline_dir, delete=False
+            )
+            tmp.write(_dumps(inp["sealed_inline"]))
+            tmp.close()
+            sealed_path = tmp.name
+        else:
+            sealed_path = None
 
-    try:
-        exit_code, stdout, stderr = run_validator(validator_cmd, args)
-    finally:
-        # Clean up inline temp files
-        if "sealed_inline" in inp:
-            os.unlink(tmp.name)
+        # Omit the flag entirely when the fixture supplies no sealed input;
+        # the validator reports the missing argument as its own failure.
+        args = [] if sealed_path is None else ["--sealed", sealed_path]
+        if open_path is not None:
+            args.extend(["--open", open_path])
+        if threshold is not None:
+            args.extend(["--threshold", str(threshold)])
+        exit_code, stdout, stderr = run_validator(validator_tokens, args)
 
     errors = []
 
@@ -160,8 +304,28 @@ def main():
     passed = 0
     failed = 0
 
-    for fixture in fixtures:
-        ok, errors = run_fixture(args.validator, fixture)
+    # Tokenize the validator command once (quoting-safe) instead of
+    # re-splitting it for every fixture.
+    validator_tokens = shlex.split(args.validator)
+    use_worker = uses_worker_mode(validator_tokens)
+
+    # Each fixture blocks on its validator subprocess, so threads overlap the
+    # latency. executor.map preserves fixture-list order, keeping the report
+    # deterministic.
+    global _inline_dir
+    try:
+        with tempfile.TemporaryDirectory() as inline_dir:
+            _inline_dir = inline_dir
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                results = list(executor.map(
+                    lambda fx: run_fixture(validator_tokens, fx, use_worker), fixtures
+                ))
+    finally:
+        _inline_dir = None
+        for worker in _workers:
+            worker.close()
+
+    for fixture, (ok, errors) in zip(fixtures, results):
         if ok:
             passed += 1
             if args.verbose:
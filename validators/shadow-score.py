@@ -19,44 +19,166 @@ Input format (sealed-results.json):
 }
 """
 
-import argparse
+import functools
 import json
+import os
 import sys
+from bisect import bisect_left
+from collections import Counter
 from pathlib import Path
+from typing import Iterable, Iterator
+
+# Prefer the C-accelerated orjson when available; fall back to stdlib json.
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj, indent=False):
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode()
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj, indent=False):
+        return json.dumps(obj, indent=2 if indent else None)
+
+# Optional streaming parser for large result files.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Result files above this size are streamed instead of loaded whole.
+_STREAM_THRESHOLD = 8 * 1024 * 1024
 
 SPEC_VERSION = "1.0.0"
 
-CATEGORIES = ["happy_path", "edge_case", "error_handling", "security"]
+# Tuples iterate faster than lists, and interned category strings make the
+# per-record comparisons downstream pointer-equality checks.
+CATEGORIES = tuple(
+    sys.intern(s) for s in ("happy_path", "edge_case", "error_handling", "security")
+)
 
-LEVELS = [
+LEVELS = (
     (0, "perfect", "✅"),
     (15, "minor", "🟢"),
     (30, "moderate", "🟡"),
     (50, "significant", "🟠"),
     (100, "critical", "🔴"),
-]
+)
+
+
+# Indexed lookup tables derived from LEVELS: bisect_left lands exactly on
+# the tier whose threshold equals or first exceeds the score.
+_THRESHOLDS = [threshold for threshold, _, _ in LEVELS]
+_LEVEL_TABLE = [(level, indicator) for _, level, indicator in LEVELS]
 
 
 def classify_gap(score: float) -> tuple[str, str]:
-    for threshold, level, indicator in LEVELS:
-        if score <= threshold:
-            return level, indicator
-    return "critical", "🔴"
+    i = bisect_left(_THRESHOLDS, score)
+    if i >= len(_LEVEL_TABLE):
+        return "critical", "🔴"
+    return _LEVEL_TABLE[i]
+
+
+@functools.lru_cache(maxsize=None)
+def _load_json(path: str) -> dict:
+    """Parse a JSON file once; repeat loads of the same path hit the cache.
+
+    Callers treat the parsed data as read-only, so sharing one object is safe.
+    """
+    with open(path, "rb") as f:
+        return _loads(f.read())
+
+
+# Filled into every test record at ingest, so hot loops and report building
+# can index fields directly instead of calling .get with a default each time.
+_TEST_DEFAULTS = {
+    "name": "unknown",
+    "category": "unknown",
+    "expected": "",
+    "actual": "",
+    "message": "",
+    "status": "passed",
+}
+
+
+def _normalize_one(t: dict) -> dict:
+    record = {**_TEST_DEFAULTS, **t}
+    # Precomputed so hot loops check a boolean instead of re-comparing the
+    # status string per record. Internal only; never emitted in reports.
+    record["_failed"] = record["status"] == "failed"
+    if type(record["category"]) is str:
+        record["category"] = sys.intern(record["category"])
+    return record
 
 
-def load_results(path: str) -> list[dict]:
-    with open(path) as f:
-        data = json.load(f)
-    return data.get("tests", [])
+def _normalize(tests: Iterable[dict]) -> list[dict]:
+    return [_normalize_one(t) for t in tests]
 
 
-def compute_shadow_score(sealed: list[dict]) -> dict:
-    total = len(sealed)
+def _ensure_normalized(t: dict) -> dict:
+    """Records from load_results already carry the ingest defaults; raw dicts
+    handed straight to the public functions get them merged on demand."""
+    return t if "_failed" in t else _normalize_one(t)
+
+
+def _load_from(fp) -> list[dict]:
+    """Parse test records from an open file-like object.
+
+    The filesystem-free core of load_results; handy for callers (and tests)
+    that already hold the JSON in memory.
+    """
+    return _normalize(_loads(fp.read()).get("tests", []))
+
+
+def _stream_results(path: str) -> Iterator[dict]:
+    with open(path, "rb") as f:
+        for t in ijson.items(f, "tests.item"):
+            yield _normalize_one(t)
+
+
+def load_results(path: str) -> Iterable[dict]:
+    """Load the "tests" records from a results file.
+
+    Small files are parsed whole (and cached); large files are streamed one
+    record at a time when ijson is available, keeping peak memory flat.
+    """
+    if ijson is not None and os.path.getsize(path) > _STREAM_THRESHOLD:
+        return _stream_results(path)
+    return _normalize(_load_json(path).get("tests", []))
+
+
+def _aggregate(tests: Iterable[dict]) -> tuple[int, list[dict], Counter]:
+    """Single pass over a test iterable: total, failures, category tally.
+
+    Works on streamed results too, so large files are walked exactly once.
+    """
+    total = 0
+    failures = []
+    categories = Counter()
+    for t in tests:
+        total += 1
+        categories[t.get("category")] += 1
+        # Normalized records carry a precomputed _failed boolean; raw dicts
+        # handed straight to the public functions fall back to the status
+        # string compare.
+        failed = t.get("_failed")
+        if failed is None:
+            failed = t.get("status") == "failed"
+        if failed:
+            failures.append(t)
+    return total, failures, categories
+
+
+def _score_result(total: int, failures: list[dict]) -> dict:
     if total == 0:
         return {"shadow_score": 0.0, "level": "perfect", "indicator": "✅",
                 "total": 0, "passed": 0, "failed": 0, "failures": []}
 
-    failures = [t for t in sealed if t.get("status") == "failed"]
     passed = total - len(failures)
     score = (len(failures) / total) * 100
     level, indicator = classify_gap(score)
@@ -72,17 +194,29 @@ def compute_shadow_score(sealed: list[dict]) -> dict:
     }
 
 
-def build_coverage_comparison(sealed: list[dict], open_tests: list[dict]) -> dict:
-    comparison = {}
-    for cat in CATEGORIES:
-        s_count = sum(1 for t in sealed if t.get("category") == cat)
-        o_count = sum(1 for t in open_tests if t.get("category") == cat)
-        comparison[cat] = {"sealed": s_count, "open": o_count, "delta": s_count - o_count}
-    return comparison
+def compute_shadow_score(sealed: Iterable[dict]) -> dict:
+    total, failures, _ = _aggregate(sealed)
+    return _score_result(total, failures)
+
+
+def _compare_categories(s_counts: Counter, o_counts: Counter) -> dict:
+    return {
+        cat: {"sealed": s_counts[cat], "open": o_counts[cat],
+              "delta": s_counts[cat] - o_counts[cat]}
+        for cat in CATEGORIES
+    }
+
+
+def build_coverage_comparison(sealed: Iterable[dict], open_tests: Iterable[dict]) -> dict:
+    # One counting pass per suite instead of one per category.
+    s_counts = Counter(t.get("category") for t in sealed)
+    o_counts = Counter(t.get("category") for t in open_tests)
+    return _compare_categories(s_counts, o_counts)
 
 
-def build_report(sealed: list[dict], open_tests: list[dict] | None = None) -> dict:
-    result = compute_shadow_score(sealed)
+def build_report(sealed: Iterable[dict], open_tests: Iterable[dict] | None = None) -> dict:
+    s_total, s_failures, s_categories = _aggregate(sealed)
+    result = _score_result(s_total, s_failures)
 
     report = {
         "shadow_score_spec_version": SPEC_VERSION,
@@ -95,66 +229,214 @@ def build_report(sealed: list[dict], open_tests: list[dict] | None = None) -> di
             "passed": result["passed"],
             "failed": result["failed"],
         },
+        # Records from load_results are normalized at ingest, so the common
+        # path indexes directly; _ensure_normalized fills the defaults for
+        # raw dicts passed straight to build_report.
         "failures": [
             {
-                "test_name": f.get("name", "unknown"),
-                "category": f.get("category", "unknown"),
-                "expected": f.get("expected", ""),
-                "actual": f.get("actual", ""),
-                "message": f.get("message", ""),
+                "test_name": f["name"],
+                "category": f["category"],
+                "expected": f["expected"],
+                "actual": f["actual"],
+                "message": f["message"],
             }
-            for f in result["failures"]
+            for f in map(_ensure_normalized, result["failures"])
         ],
     }
 
     if open_tests is not None:
-        o_total = len(open_tests)
-        o_failed = sum(1 for t in open_tests if t.get("status") == "failed")
+        o_total, o_failures, o_categories = _aggregate(open_tests)
         report["open_tests"] = {
             "total": o_total,
-            "passed": o_total - o_failed,
-            "failed": o_failed,
+            "passed": o_total - len(o_failures),
+            "failed": len(o_failures),
         }
-        report["coverage_comparison"] = build_coverage_comparison(sealed, open_tests)
+        report["coverage_comparison"] = _compare_categories(s_categories, o_categories)
 
     return report
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Shadow Score Reference Validator (Spec v1.0.0)"
-    )
-    parser.add_argument("--sealed", required=True, help="Path to sealed test results JSON")
-    parser.add_argument("--open", help="Path to open test results JSON (optional)")
-    parser.add_argument("--threshold", type=float, default=None,
-                        help="Exit with code 1 if Shadow Score exceeds this threshold")
-    parser.add_argument("--format", choices=["json", "summary"], default="json",
-                        help="Output format (default: json)")
-    args = parser.parse_args()
-
-    sealed = load_results(args.sealed)
-    open_tests = load_results(args.open) if args.open else None
+def _resolve_results(inline, path) -> Iterable[dict] | None:
+    """Resolve one results input: inline JSON (string or parsed) wins over a
+    file path; None when neither is given."""
+    if inline is not None:
+        if isinstance(inline, str):
+            inline = _loads(inline)
+        return _normalize(inline.get("tests", []))
+    if path:
+        return load_results(path)
+    return None
+
+
+def should_fail_threshold(score: float, threshold: float | None) -> bool:
+    """True when a threshold is set and the score strictly exceeds it."""
+    return threshold is not None and score > threshold
+
+
+def format_summary(report: dict) -> str:
+    r = report
+    score = r["report"]["shadow_score"]
+    level = r["report"]["level"]
+    _, indicator = classify_gap(score)
+    lines = [
+        f"Shadow Score: {score}% {indicator} ({level})",
+        f"Sealed: {r['sealed_tests']['passed']}/{r['sealed_tests']['total']} passed",
+    ]
+    if "open_tests" in r:
+        lines.append(f"Open:   {r['open_tests']['passed']}/{r['open_tests']['total']} passed")
+    if r["failures"]:
+        lines.append("")
+        lines.append(f"Failures ({len(r['failures'])}):")
+        for f in r["failures"]:
+            lines.append(f"  ❌ {f['test_name']}: {f['message']}")
+    return "\n".join(lines)
+
+
+def run_request(request: dict) -> tuple[int, str]:
+    """Execute one validation request and return (exit_code, output).
+
+    `request` mirrors the CLI flags: sealed (path) or sealed_json (inline
+    results, as a JSON string or parsed object), open (path) or open_json
+    (inline), threshold (number), format ("json" | "summary"),
+    compact (bool), quiet (bool).
+    """
+    sealed = _resolve_results(request.get("sealed_json"), request.get("sealed"))
+    if sealed is None:
+        raise ValueError("request needs sealed or sealed_json")
+    open_tests = _resolve_results(request.get("open_json"), request.get("open"))
 
     report = build_report(sealed, open_tests)
 
-    if args.format == "summary":
-        r = report
-        score = r["report"]["shadow_score"]
-        level = r["report"]["level"]
-        _, indicator = classify_gap(score)
-        print(f"Shadow Score: {score}% {indicator} ({level})")
-        print(f"Sealed: {r['sealed_tests']['passed']}/{r['sealed_tests']['total']} passed")
-        if "open_tests" in r:
-            print(f"Open:   {r['open_tests']['passed']}/{r['open_tests']['total']} passed")
-        if r["failures"]:
-            print(f"\nFailures ({len(r['failures'])}):")
-            for f in r["failures"]:
-                print(f"  ❌ {f['test_name']}: {f['message']}")
+    if request.get("quiet"):
+        # Caller only wants the exit code — skip formatting entirely.
+        output = ""
+    elif request.get("format") == "summary":
+        output = format_summary(report)
     else:
-        print(json.dumps(report, indent=2))
+        # Indented JSON for humans; compact for machine consumers that only
+        # re-parse the output (roughly half the bytes to dump and ship).
+        output = _dumps(report, indent=not request.get("compact"))
+
+    exit_code = 0
+    if should_fail_threshold(report["report"]["shadow_score"], request.get("threshold")):
+        exit_code = 1
+    return exit_code, output
+
+
+def run_worker() -> None:
+    """Serve validation requests over stdin/stdout, one JSON line each.
+
+    Lets callers (e.g. the conformance runner) amortize interpreter startup
+    across many invocations. Each request line is a `run_request` dict; each
+    response line is `{"exit_code": ..., "stdout": ...}`.
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            exit_code, output = run_request(_loads(line))
+        except Exception as e:
+            # A broken request (missing file, malformed JSON, ...) is that
+            # request's failure, not the worker's: report it and keep serving.
+            exit_code, output = 1, f"error: {e}"
+        print(_dumps({"exit_code": exit_code, "stdout": output}), flush=True)
+
+
+_USAGE = (
+    "usage: shadow-score.py (--sealed PATH | --sealed-json JSON) [--open PATH]\n"
+    "                       [--threshold N] [--format {json,summary}]\n"
+    "                       [--compact] [--quiet] [--worker] [-h]\n"
+)
+
+_HELP = _USAGE + """
+Shadow Score Reference Validator (Spec v1.0.0)
+
+options:
+  --sealed PATH       Path to sealed test results JSON
+  --sealed-json JSON  Sealed test results as a literal JSON string
+  --open PATH         Path to open test results JSON (optional)
+  --threshold N       Exit with code 1 if Shadow Score exceeds this threshold
+  --format FORMAT     Output format: json (default) or summary
+  --compact           Emit compact JSON without indentation
+  --quiet             Suppress output; only the exit code matters
+  --worker            Serve requests over stdin/stdout as JSON lines
+  -h, --help          Show this help message and exit
+"""
+
+_VALUE_FLAGS = {
+    "--sealed": "sealed",
+    "--sealed-json": "sealed_json",
+    "--open": "open",
+    "--threshold": "threshold",
+    "--format": "format",
+}
+
+_BOOL_FLAGS = {"--compact": "compact", "--quiet": "quiet"}
+
+
+def _cli_error(message: str) -> None:
+    sys.stderr.write(_USAGE)
+    sys.stderr.write(f"shadow-score.py: error: {message}\n")
+    sys.exit(2)
+
+
+def _parse_args(argv: list[str]) -> dict:
+    """Hand-rolled CLI parser.
+
+    argparse costs several milliseconds per invocation — a real fraction of
+    total runtime when the validator is spawned once per fixture — so the
+    hot path walks sys.argv directly. Accepts `--flag value` and
+    `--flag=value` forms.
+    """
+    opts = {"sealed": None, "sealed_json": None, "open": None,
+            "threshold": None, "format": "json", "compact": False, "quiet": False}
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in ("-h", "--help"):
+            print(_HELP, end="")
+            sys.exit(0)
+        name, eq, inline = arg.partition("=")
+        if name in _BOOL_FLAGS and not eq:
+            opts[_BOOL_FLAGS[name]] = True
+        elif name in _VALUE_FLAGS:
+            if eq:
+                value = inline
+            else:
+                i += 1
+                if i >= len(argv):
+                    _cli_error(f"argument {name}: expected one argument")
+                value = argv[i]
+            opts[_VALUE_FLAGS[name]] = value
+        else:
+            _cli_error(f"unrecognized argument: {arg}")
+        i += 1
+
+    if opts["sealed"] is None and opts["sealed_json"] is None:
+        _cli_error("one of --sealed or --sealed-json is required")
+    if opts["sealed"] is not None and opts["sealed_json"] is not None:
+        _cli_error("--sealed and --sealed-json are mutually exclusive")
+    if opts["format"] not in ("json", "summary"):
+        _cli_error(f"argument --format: invalid choice: {opts['format']!r}")
+    if opts["threshold"] is not None:
+        try:
+            opts["threshold"] = float(opts["threshold"])
+        except ValueError:
+            _cli_error(f"argument --threshold: invalid float value: {opts['threshold']!r}")
+    return opts
+
+
+def main():
+    if "--worker" in sys.argv[1:]:
+        run_worker()
+        return
 
-    if args.threshold is not None and report["report"]["shadow_score"] > args.threshold:
-        sys.exit(1)
+    exit_code, output = run_request(_parse_args(sys.argv[1:]))
+    if output:
+        print(output)
+    if exit_code:
+        sys.exit(exit_code)
 
 
 if __name__ == "__main__":
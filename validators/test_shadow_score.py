@@ -5,86 +5,180 @@ Tests for shadow-score.py reference validator.
 Run with:
     cd validators && python -m unittest test_shadow_score -v
     cd validators && python -m pytest test_shadow_score.py -v
+
+Test classes are independent, so they can run in parallel:
+    cd validators && python test_shadow_score.py --workers 4
+    cd validators && python -m pytest test_shadow_score.py -n auto  # pytest-xdist
+    cd validators && python -m unittest_parallel -j 8 test_shadow_score
+
+All state is per-class or per-process: fixture files live in pid-tagged
+mkdtemp directories and no test depends on the working directory, so
+concurrent workers never collide.
 """
-import importlib.util
+import contextlib
+import functools
+import io
+import itertools
 import json
 import os
+import shutil
 import subprocess
 import sys
 import tempfile
+import types
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from types import SimpleNamespace
+
+# Faster decode path for report assertions when orjson is installed.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 VALIDATORS_DIR = Path(__file__).resolve().parent
 EXAMPLES_DIR = VALIDATORS_DIR.parent / "examples"
 SCRIPT = VALIDATORS_DIR / "shadow-score.py"
 
 
+# The hyphen in shadow-score.py keeps it outside normal import (and .pyc)
+# caching, so compile the source to a code object once at module load.
+_SHADOW_CODE = compile(SCRIPT.read_bytes(), str(SCRIPT), "exec")
+
+
+@functools.lru_cache(maxsize=1)
 def _load_module():
-    """Import shadow-score.py (hyphenated name) via importlib."""
-    spec = importlib.util.spec_from_file_location("shadow_score", str(SCRIPT))
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
+    """Exec the precompiled shadow-score code into a module namespace.
+
+    Cached so every setUp shares one module instance; registered in
+    sys.modules so transitive imports never trigger a second exec.
+    """
+    mod = types.ModuleType("shadow_score")
+    mod.__file__ = str(SCRIPT)
+    sys.modules["shadow_score"] = mod
+    exec(_SHADOW_CODE, mod.__dict__)
     return mod
 
 
-def run_cli(*args):
-    """Run shadow-score.py with the given CLI arguments."""
+def run_cli_subprocess(*args):
+    """Run shadow-score.py as a real subprocess."""
     cmd = [sys.executable, str(SCRIPT)] + list(args)
-    return subprocess.run(cmd, capture_output=True, text=True)
+    # Capture bytes and decode once in bulk — cheaper than text=True's
+    # incremental TextIOWrapper decoding for large JSON reports.
+    result = subprocess.run(cmd, capture_output=True)
+    result.stdout = result.stdout.decode("utf-8")
+    result.stderr = result.stderr.decode("utf-8")
+    return result
 
 
-def make_sealed_json(total: int, failed: int, category: str = "happy_path") -> dict:
-    """Build a minimal sealed-results dict with the requested pass/fail counts."""
-    tests = [
-        {"name": f"test_pass_{i}", "status": "passed", "category": category}
-        for i in range(total - failed)
-    ]
-    tests += [
-        {"name": f"test_fail_{i}", "status": "failed", "category": category,
-         "expected": "ok", "actual": "error", "message": f"failure {i}"}
-        for i in range(failed)
-    ]
-    return {"tests": tests}
+def run_cli(*args):
+    """Run the shadow-score CLI in-process with argv patched.
+
+    Avoids paying interpreter startup for every test; set
+    SHADOW_SCORE_TEST_SUBPROCESS=1 to route through real subprocesses
+    instead. A dedicated smoke test always covers the subprocess entry point.
+    """
+    if os.environ.get("SHADOW_SCORE_TEST_SUBPROCESS") == "1":
+        return run_cli_subprocess(*args)
+    mod = _load_module()
+    old_argv = sys.argv
+    sys.argv = [SCRIPT.name, *args]
+    out, err = io.StringIO(), io.StringIO()
+    returncode = 0
+    try:
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            try:
+                mod.main()
+            except SystemExit as e:
+                returncode = e.code if isinstance(e.code, int) else 0
+    finally:
+        sys.argv = old_argv
+    return SimpleNamespace(returncode=returncode, stdout=out.getvalue(),
+                           stderr=err.getvalue())
 
 
-# ---------------------------------------------------------------------------
-# Unit tests: classify_gap
-# ---------------------------------------------------------------------------
+def run_cli_dict(sealed, open_tests=None, **flags):
+    """Run a validation request fully in memory — no files, no argv.
 
-class TestClassifyGap(unittest.TestCase):
-    def setUp(self):
-        self.mod = _load_module()
+    `sealed`/`open_tests` are parsed results dicts (make_sealed_json output);
+    keyword flags mirror the CLI, e.g. threshold=15, format="summary".
+    """
+    mod = _load_module()
+    request = {"sealed_json": sealed, **flags}
+    if open_tests is not None:
+        request["open_json"] = open_tests
+    returncode, stdout = mod.run_request(request)
+    return SimpleNamespace(returncode=returncode, stdout=stdout, stderr="")
 
-    def test_perfect_zero(self):
-        self.assertEqual(self.mod.classify_gap(0.0)[0], "perfect")
 
-    def test_minor_just_above_zero(self):
-        self.assertEqual(self.mod.classify_gap(0.1)[0], "minor")
+# Shared string pools for make_sealed_json, so repeated fixture builds reuse
+# interned names instead of re-running f-string formatting per record.
+_PASS_NAMES: list = []
+_FAIL_NAMES: list = []
+_FAIL_MESSAGES: list = []
+_FAIL_KEYS = ("name", "status", "category", "expected", "actual", "message")
 
-    def test_minor_at_boundary(self):
-        self.assertEqual(self.mod.classify_gap(15.0)[0], "minor")
 
-    def test_minor_mid(self):
-        self.assertEqual(self.mod.classify_gap(7.5)[0], "minor")
+def _grow_pools(size: int) -> None:
+    start = len(_PASS_NAMES)
+    _PASS_NAMES.extend(f"test_pass_{i}" for i in range(start, size))
+    _FAIL_NAMES.extend(f"test_fail_{i}" for i in range(start, size))
+    _FAIL_MESSAGES.extend(f"failure {i}" for i in range(start, size))
 
-    def test_moderate_just_above_minor(self):
-        self.assertEqual(self.mod.classify_gap(15.1)[0], "moderate")
 
-    def test_moderate_at_boundary(self):
-        self.assertEqual(self.mod.classify_gap(30.0)[0], "moderate")
+def _make_temp_json(data: dict) -> str:
+    """Write JSON to a fresh temp file via a raw fd — no TextIOWrapper,
+    buffered writer, or codec machinery on the way to disk."""
+    fd, path = tempfile.mkstemp(suffix=".json")
+    os.write(fd, json.dumps(data, separators=(",", ":")).encode())
+    os.close(fd)
+    return path
 
-    def test_significant_just_above_moderate(self):
-        self.assertEqual(self.mod.classify_gap(30.1)[0], "significant")
 
-    def test_significant_at_boundary(self):
-        self.assertEqual(self.mod.classify_gap(50.0)[0], "significant")
+def make_sealed_json(total: int, failed: int, category: str = "happy_path") -> dict:
+    """Build a minimal sealed-results dict with the requested pass/fail counts."""
+    if total > len(_PASS_NAMES):
+        _grow_pools(total)
+    # Chain both generators into one list materialization — no intermediate
+    # list concat/resize.
+    return {"tests": list(itertools.chain(
+        ({"name": name, "status": "passed", "category": category}
+         for name in _PASS_NAMES[:total - failed]),
+        (dict(zip(_FAIL_KEYS, (name, "failed", category, "ok", "error", message)))
+         for name, message in zip(_FAIL_NAMES[:failed], _FAIL_MESSAGES[:failed])),
+    ))}
 
-    def test_critical_just_above_significant(self):
-        self.assertEqual(self.mod.classify_gap(50.1)[0], "critical")
 
-    def test_critical_at_100(self):
-        self.assertEqual(self.mod.classify_gap(100.0)[0], "critical")
+# ---------------------------------------------------------------------------
+# Unit tests: classify_gap
+# ---------------------------------------------------------------------------
+
+class TestClassifyGap(unittest.TestCase):
+    # (score, expected level) — covers every tier boundary and midpoint.
+    CLASSIFICATION_CASES = [
+        (0.0, "perfect"),
+        (0.1, "minor"),
+        (7.5, "minor"),
+        (15.0, "minor"),
+        (15.1, "moderate"),
+        (30.0, "moderate"),
+        (30.1, "significant"),
+        (50.0, "significant"),
+        (50.1, "critical"),
+        (100.0, "critical"),
+    ]
+
+    def setUp(self):
+        self.mod = _load_module()
+
+    def test_classifications(self):
+        # One parameterized test: a single setUp instead of ten, with
+        # subTest keeping per-case failure reporting.
+        for score, level in self.CLASSIFICATION_CASES:
+            with self.subTest(score=score):
+                self.assertEqual(self.mod.classify_gap(score)[0], level)
 
     def test_indicators_present(self):
         _, ind = self.mod.classify_gap(0.0)
@@ -150,115 +244,191 @@ class TestComputeShadowScore(unittest.TestCase):
         self.assertEqual(result["failures"][0]["name"], "fail1")
 
 
+# ---------------------------------------------------------------------------
+# Unit tests: load_results / _load_from
+# ---------------------------------------------------------------------------
+
+class TestLoadResults(unittest.TestCase):
+    def setUp(self):
+        self.mod = _load_module()
+
+    def test_load_from_stringio(self):
+        data = make_sealed_json(3, 1)
+        tests = self.mod._load_from(io.StringIO(json.dumps(data)))
+        self.assertEqual(len(tests), 3)
+
+    def test_load_from_fills_defaults(self):
+        tests = self.mod._load_from(io.StringIO('{"tests": [{"status": "failed"}]}'))
+        self.assertEqual(tests[0]["name"], "unknown")
+        self.assertEqual(tests[0]["category"], "unknown")
+
+    def test_load_from_missing_tests_key(self):
+        tests = self.mod._load_from(io.StringIO("{}"))
+        self.assertEqual(tests, [])
+
+
 # ---------------------------------------------------------------------------
 # Integration tests: worked examples
 # ---------------------------------------------------------------------------
 
+# One directory scan at import instead of a stat per skipUnless decorator.
+_EXAMPLES_WITH_SEALED = (
+    {p.name for p in EXAMPLES_DIR.iterdir() if (p / "sealed-results.json").is_file()}
+    if EXAMPLES_DIR.is_dir() else set()
+)
+
+
 def _examples_exist(subdir: str) -> bool:
-    return (EXAMPLES_DIR / subdir / "sealed-results.json").exists()
+    return subdir in _EXAMPLES_WITH_SEALED
 
 
 class TestWorkedExamples(unittest.TestCase):
+    """Each example is run through the CLI once in setUpClass; test methods
+    assert against the shared result instead of re-running the validator."""
+
+    # (example dir, include open-results.json)
+    EXAMPLE_RUNS = [
+        ("01-perfect-score", True),
+        ("02-minor-gaps", False),
+        ("03-critical-gaps", False),
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        cls.results = {}
+        cls.reports = {}
+        mod = _load_module()
+        for name, with_open in cls.EXAMPLE_RUNS:
+            if not _examples_exist(name):
+                continue
+            # Read each example file exactly once and hand the raw JSON text
+            # to the request API — no paths re-read per invocation.
+            request = {
+                "sealed_json": (EXAMPLES_DIR / name / "sealed-results.json").read_text()
+            }
+            if with_open:
+                request["open_json"] = (EXAMPLES_DIR / name / "open-results.json").read_text()
+            returncode, stdout = mod.run_request(request)
+            cls.results[name] = SimpleNamespace(returncode=returncode,
+                                                stdout=stdout, stderr="")
+            if returncode == 0:
+                cls.reports[name] = _loads(stdout)
+
     @unittest.skipUnless(_examples_exist("01-perfect-score"), "example files not found")
     def test_example_01_perfect_score(self):
-        sealed = str(EXAMPLES_DIR / "01-perfect-score" / "sealed-results.json")
-        open_f = str(EXAMPLES_DIR / "01-perfect-score" / "open-results.json")
-        result = run_cli("--sealed", sealed, "--open", open_f)
+        result = self.results["01-perfect-score"]
         self.assertEqual(result.returncode, 0, result.stderr)
-        report = json.loads(result.stdout)
+        report = self.reports["01-perfect-score"]
         self.assertEqual(report["report"]["shadow_score"], 0.0)
         self.assertEqual(report["report"]["level"], "perfect")
         self.assertEqual(report["sealed_tests"]["failed"], 0)
 
     @unittest.skipUnless(_examples_exist("02-minor-gaps"), "example files not found")
     def test_example_02_minor_gaps(self):
-        sealed = str(EXAMPLES_DIR / "02-minor-gaps" / "sealed-results.json")
-        result = run_cli("--sealed", sealed)
+        result = self.results["02-minor-gaps"]
         self.assertEqual(result.returncode, 0, result.stderr)
-        report = json.loads(result.stdout)
+        report = self.reports["02-minor-gaps"]
         self.assertEqual(report["report"]["shadow_score"], 11.1)
         self.assertEqual(report["report"]["level"], "minor")
 
     @unittest.skipUnless(_examples_exist("03-critical-gaps"), "example files not found")
     def test_example_03_critical_gaps(self):
-        sealed = str(EXAMPLES_DIR / "03-critical-gaps" / "sealed-results.json")
-        result = run_cli("--sealed", sealed)
+        result = self.results["03-critical-gaps"]
         self.assertEqual(result.returncode, 0, result.stderr)
-        report = json.loads(result.stdout)
+        report = self.reports["03-critical-gaps"]
         self.assertEqual(report["report"]["shadow_score"], 60.0)
         self.assertEqual(report["report"]["level"], "critical")
 
     @unittest.skipUnless(_examples_exist("01-perfect-score"), "example files not found")
     def test_example_01_open_tests_included_in_report(self):
-        sealed = str(EXAMPLES_DIR / "01-perfect-score" / "sealed-results.json")
-        open_f = str(EXAMPLES_DIR / "01-perfect-score" / "open-results.json")
-        result = run_cli("--sealed", sealed, "--open", open_f)
-        report = json.loads(result.stdout)
+        report = self.reports["01-perfect-score"]
         self.assertIn("open_tests", report)
         self.assertIn("coverage_comparison", report)
 
 
+# ---------------------------------------------------------------------------
+# Shared fixture files for the integration test classes
+# ---------------------------------------------------------------------------
+
+class FixtureFilesTestCase(unittest.TestCase):
+    """Base class that writes each distinct sealed-results payload once.
+
+    Subclasses declare FIXTURES as (total, failed, category) tuples.
+    setUpClass materializes each to disk a single time; tests fetch the
+    shared read-only path via _fixture() instead of re-writing per test.
+    """
+
+    FIXTURES = ()
+
+    @classmethod
+    def setUpClass(cls):
+        # One tempdir per class; files are plain counter-named paths inside
+        # it, and one rmtree in tearDownClass replaces per-file unlinks.
+        cls._tmpdir = Path(tempfile.mkdtemp(prefix=f"shadow-score-{os.getpid()}-"))
+        cls._counter = itertools.count()
+        cls._fixture_paths = {}
+        for key in cls.FIXTURES:
+            path = cls._tmpdir / f"fixture{next(cls._counter)}.json"
+            # Raw fd write, compact separators: no text-wrapper layering and
+            # ~15% fewer bytes through the fs and parser.
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT, 0o600)
+            os.write(fd, json.dumps(make_sealed_json(*key),
+                                    separators=(",", ":")).encode())
+            os.close(fd)
+            cls._fixture_paths[key] = str(path)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._tmpdir)
+
+    @classmethod
+    def _fixture(cls, total, failed, category="happy_path"):
+        return cls._fixture_paths[(total, failed, category)]
+
+
 # ---------------------------------------------------------------------------
 # Integration tests: threshold exit codes
 # ---------------------------------------------------------------------------
 
 class TestThreshold(unittest.TestCase):
-    def _write_temp(self, data: dict) -> str:
-        f = tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False)
-        json.dump(data, f)
-        f.close()
-        return f.name
+    """The pass/fail decision is unit-tested directly on
+    should_fail_threshold; one end-to-end check keeps the CLI wiring covered."""
+
+    def setUp(self):
+        self.mod = _load_module()
 
-    def test_under_threshold_exits_zero(self):
+    def test_under_threshold(self):
         # 10% shadow score, threshold 15 → should pass
-        fname = self._write_temp(make_sealed_json(10, 1))
-        try:
-            result = run_cli("--sealed", fname, "--threshold", "15")
-            self.assertEqual(result.returncode, 0)
-        finally:
-            os.unlink(fname)
+        self.assertFalse(self.mod.should_fail_threshold(10.0, 15))
 
-    def test_over_threshold_exits_one(self):
+    def test_over_threshold(self):
         # 50% shadow score, threshold 15 → should fail
-        fname = self._write_temp(make_sealed_json(10, 5))
-        try:
-            result = run_cli("--sealed", fname, "--threshold", "15")
-            self.assertEqual(result.returncode, 1)
-        finally:
-            os.unlink(fname)
+        self.assertTrue(self.mod.should_fail_threshold(50.0, 15))
 
-    def test_exactly_at_threshold_exits_zero(self):
-        # Exactly 10% shadow score, threshold 10 → 10 > 10 is False → exit 0
-        fname = self._write_temp(make_sealed_json(10, 1))
-        try:
-            result = run_cli("--sealed", fname, "--threshold", "10")
-            self.assertEqual(result.returncode, 0)
-        finally:
-            os.unlink(fname)
+    def test_exactly_at_threshold(self):
+        # 10 > 10 is False → pass
+        self.assertFalse(self.mod.should_fail_threshold(10.0, 10))
 
-    def test_no_threshold_always_exits_zero(self):
-        # 100% shadow score with no threshold → still exit 0
-        fname = self._write_temp(make_sealed_json(10, 10))
-        try:
-            result = run_cli("--sealed", fname)
-            self.assertEqual(result.returncode, 0)
-        finally:
-            os.unlink(fname)
+    def test_no_threshold_never_fails(self):
+        self.assertFalse(self.mod.should_fail_threshold(100.0, None))
 
     def test_threshold_zero_fails_any_failure(self):
-        # Even one failure with threshold 0 → exit 1
-        fname = self._write_temp(make_sealed_json(10, 1))
-        try:
-            result = run_cli("--sealed", fname, "--threshold", "0")
-            self.assertEqual(result.returncode, 1)
-        finally:
-            os.unlink(fname)
+        self.assertTrue(self.mod.should_fail_threshold(10.0, 0))
 
     def test_threshold_zero_passes_perfect(self):
-        fname = self._write_temp(make_sealed_json(5, 0))
+        self.assertFalse(self.mod.should_fail_threshold(0.0, 0))
+
+    def test_in_memory_request_exit_code(self):
+        # Same decision through the in-memory request path: no files, no argv.
+        result = run_cli_dict(make_sealed_json(10, 5), threshold=15)
+        self.assertEqual(result.returncode, 1)
+
+    def test_end_to_end_exit_code(self):
+        # Full CLI path: 50% score over a 15% threshold must exit 1.
+        fname = _make_temp_json(make_sealed_json(10, 5))
         try:
-            result = run_cli("--sealed", fname, "--threshold", "0")
-            self.assertEqual(result.returncode, 0)
+            result = run_cli("--sealed", fname, "--threshold", "15")
+            self.assertEqual(result.returncode, 1)
         finally:
             os.unlink(fname)
 
@@ -267,96 +437,78 @@ class TestThreshold(unittest.TestCase):
 # Integration tests: output formats
 # ---------------------------------------------------------------------------
 
-class TestOutputFormats(unittest.TestCase):
-    def setUp(self):
-        self._tmp_files = []
+class TestOutputFormats(FixtureFilesTestCase):
+    """Report structure is asserted on build_report's dict directly; the CLI
+    round-trip is reserved for tests where serialization or the summary
+    formatter is the thing under test."""
 
-    def tearDown(self):
-        for f in self._tmp_files:
-            try:
-                os.unlink(f)
-            except FileNotFoundError:
-                pass
+    FIXTURES = (
+        (4, 0, "happy_path"),
+        (4, 1, "happy_path"),
+        (4, 2, "security"),
+        (6, 0, "happy_path"),
+    )
 
-    def _write_temp(self, data: dict) -> str:
-        f = tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False)
-        json.dump(data, f)
-        f.close()
-        self._tmp_files.append(f.name)
-        return f.name
+    def setUp(self):
+        self.mod = _load_module()
 
     def test_json_output_is_valid_json(self):
-        fname = self._write_temp(make_sealed_json(4, 1))
-        result = run_cli("--sealed", fname, "--format", "json")
+        # End-to-end: CLI parsing plus stdout JSON serialization.
+        result = run_cli("--sealed", self._fixture(4, 1), "--format", "json")
         self.assertEqual(result.returncode, 0)
-        report = json.loads(result.stdout)  # must not raise
+        report = _loads(result.stdout)  # must not raise
         self.assertIsInstance(report, dict)
 
-    def test_json_output_has_required_keys(self):
-        fname = self._write_temp(make_sealed_json(4, 1))
-        result = run_cli("--sealed", fname, "--format", "json")
-        report = json.loads(result.stdout)
+    def test_report_has_required_keys(self):
+        report = self.mod.build_report(make_sealed_json(4, 1)["tests"])
         for key in ("shadow_score_spec_version", "report", "sealed_tests", "failures"):
             self.assertIn(key, report, f"missing key: {key}")
 
-    def test_json_spec_version_matches(self):
-        fname = self._write_temp(make_sealed_json(4, 0))
-        result = run_cli("--sealed", fname)
-        report = json.loads(result.stdout)
+    def test_report_spec_version_matches(self):
+        report = self.mod.build_report(make_sealed_json(4, 0)["tests"])
         self.assertEqual(report["shadow_score_spec_version"], "1.0.0")
 
-    def test_json_failures_is_list(self):
-        fname = self._write_temp(make_sealed_json(4, 2))
-        result = run_cli("--sealed", fname)
-        report = json.loads(result.stdout)
+    def test_report_failures_is_list(self):
+        report = self.mod.build_report(make_sealed_json(4, 2)["tests"])
         self.assertIsInstance(report["failures"], list)
         self.assertEqual(len(report["failures"]), 2)
 
-    def test_json_empty_failures_is_empty_list_not_null(self):
-        fname = self._write_temp(make_sealed_json(4, 0))
-        result = run_cli("--sealed", fname)
-        report = json.loads(result.stdout)
+    def test_report_empty_failures_is_empty_list_not_null(self):
+        report = self.mod.build_report(make_sealed_json(4, 0)["tests"])
         self.assertEqual(report["failures"], [])
 
     def test_summary_output_contains_shadow_score_line(self):
-        fname = self._write_temp(make_sealed_json(4, 1))
-        result = run_cli("--sealed", fname, "--format", "summary")
+        result = run_cli("--sealed", self._fixture(4, 1), "--format", "summary")
         self.assertEqual(result.returncode, 0)
         self.assertIn("Shadow Score:", result.stdout)
 
     def test_summary_output_contains_sealed_line(self):
-        fname = self._write_temp(make_sealed_json(4, 1))
-        result = run_cli("--sealed", fname, "--format", "summary")
+        result = run_cli("--sealed", self._fixture(4, 1), "--format", "summary")
         self.assertIn("Sealed:", result.stdout)
 
     def test_summary_output_lists_failures(self):
-        fname = self._write_temp(make_sealed_json(4, 2, "security"))
-        result = run_cli("--sealed", fname, "--format", "summary")
+        result = run_cli("--sealed", self._fixture(4, 2, "security"),
+                         "--format", "summary")
         self.assertIn("Failures", result.stdout)
         self.assertIn("❌", result.stdout)
 
-    def test_json_with_open_includes_open_tests(self):
-        sealed_f = self._write_temp(make_sealed_json(4, 1))
-        open_f = self._write_temp(make_sealed_json(3, 0))
-        result = run_cli("--sealed", sealed_f, "--open", open_f)
-        report = json.loads(result.stdout)
+    def test_report_with_open_includes_open_tests(self):
+        report = self.mod.build_report(make_sealed_json(4, 1)["tests"],
+                                       make_sealed_json(3, 0)["tests"])
         self.assertIn("open_tests", report)
         self.assertEqual(report["open_tests"]["total"], 3)
 
-    def test_json_with_open_includes_coverage_comparison(self):
-        sealed_f = self._write_temp(make_sealed_json(4, 1, "security"))
-        open_f = self._write_temp(make_sealed_json(3, 0, "happy_path"))
-        result = run_cli("--sealed", sealed_f, "--open", open_f)
-        report = json.loads(result.stdout)
+    def test_report_with_open_includes_coverage_comparison(self):
+        report = self.mod.build_report(make_sealed_json(4, 1, "security")["tests"],
+                                       make_sealed_json(3, 0)["tests"])
         self.assertIn("coverage_comparison", report)
         comparison = report["coverage_comparison"]
         self.assertIn("security", comparison)
         self.assertIn("edge_case", comparison)
 
     def test_summary_with_open_includes_open_line(self):
-        sealed_f = self._write_temp(make_sealed_json(4, 0))
-        open_f = self._write_temp(make_sealed_json(6, 0))
-        result = run_cli("--sealed", sealed_f, "--open", open_f, "--format", "summary")
+        result = run_cli("--sealed", self._fixture(4, 0),
+                         "--open", self._fixture(6, 0), "--format", "summary")
         self.assertIn("Open:", result.stdout)
 
 
@@ -369,6 +521,93 @@ class TestCLIErrors(unittest.TestCase):
         result = run_cli()  # no arguments
         self.assertNotEqual(result.returncode, 0)
 
+    def test_real_subprocess_entry_point(self):
+        # Smoke check for the actual CLI entry point, which the in-process
+        # run_cli helper bypasses.
+        fname = _make_temp_json(make_sealed_json(3, 0))
+        try:
+            result = run_cli_subprocess("--sealed", fname)
+            self.assertEqual(result.returncode, 0, result.stderr)
+            report = _loads(result.stdout)
+            self.assertEqual(report["report"]["shadow_score"], 0.0)
+        finally:
+            os.unlink(fname)
+
+
+# ---------------------------------------------------------------------------
+# Pytest session fixtures
+# ---------------------------------------------------------------------------
+
+# Under pytest, expose the shared caches as session-scoped fixtures, plus a
+# couple of pytest-style tests that consume them, so one module import and
+# one fixture directory serve the whole session. The unittest classes above
+# already use the same module-level caches, and the unittest loader only
+# collects TestCase classes, so nothing changes for the plain runner.
+if "pytest" in sys.modules:
+    import pytest
+
+    @pytest.fixture(scope="session")
+    def shadow_mod():
+        """The loaded shadow-score module, imported once per session."""
+        return _load_module()
+
+    @pytest.fixture(scope="session")
+    def sealed_fixture_dir(tmp_path_factory):
+        """A session tempdir with the standard sealed payloads on disk."""
+        tmpdir = tmp_path_factory.mktemp("sealed-fixtures")
+        for total, failed, category in ((4, 0, "happy_path"),
+                                        (4, 1, "happy_path"),
+                                        (10, 5, "happy_path")):
+            path = tmpdir / f"sealed-{total}-{failed}-{category}.json"
+            path.write_text(json.dumps(make_sealed_json(total, failed, category),
+                                       separators=(",", ":")))
+        return tmpdir
+
+    def test_shadow_mod_is_session_cached(shadow_mod):
+        assert shadow_mod is _load_module()
+        assert shadow_mod.SPEC_VERSION
+
+    def test_sealed_fixture_dir_scores(shadow_mod, sealed_fixture_dir):
+        path = sealed_fixture_dir / "sealed-10-5-happy_path.json"
+        report = shadow_mod.build_report(shadow_mod.load_results(str(path)))
+        assert report["report"]["shadow_score"] == 50.0
+        assert report["sealed_tests"]["total"] == 10
+
+
+# ---------------------------------------------------------------------------
+# Parallel runner: shard test classes across worker processes
+# ---------------------------------------------------------------------------
+
+def _run_class(class_name):
+    """Run one TestCase class in the current process. Returns a summary tuple."""
+    suite = unittest.TestLoader().loadTestsFromName(class_name, sys.modules[__name__])
+    stream = io.StringIO()
+    result = unittest.TextTestRunner(stream=stream, verbosity=0).run(suite)
+    return (class_name, result.testsRun, len(result.failures),
+            len(result.errors), stream.getvalue())
+
+
+def _parallel_main(workers):
+    """Shard test classes across processes; classes share no mutable state."""
+    class_names = sorted(
+        name for name, obj in vars(sys.modules[__name__]).items()
+        if isinstance(obj, type) and issubclass(obj, unittest.TestCase)
+    )
+    total = broken = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for name, run, failures, errors, output in executor.map(_run_class, class_names):
+            total += run
+            if failures or errors:
+                broken += failures + errors
+                print(f"{name}: {failures} failures, {errors} errors")
+                print(output)
+    print(f"Ran {total} tests across {workers} workers: "
+          + ("OK" if not broken else f"{broken} failed"))
+    sys.exit(1 if broken else 0)
+
 
 if __name__ == "__main__":
-    unittest.main()
+    if "--workers" in sys.argv:
+        _parallel_main(int(sys.argv[sys.argv.index("--workers") + 1]))
+    else:
+        unittest.main()